@@ -1,7 +1,8 @@
 """Main CodeBuilder class for code generation."""
 
-from typing import List, Optional
-from contextlib import contextmanager
+import io
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, TextIO, Tuple
 
 from codecraft.core.node import (
     Node,
@@ -11,9 +12,69 @@ from codecraft.core.node import (
     DocstringNode,
 )
 from codecraft.core.context import ClassContext, FunctionContext, ControlFlowContext
+from codecraft.elements.control_flow import (
+    IfNode,
+    ElifNode,
+    ElseNode,
+    ForNode,
+    WhileNode,
+    TryNode,
+    ExceptNode,
+    FinallyNode,
+    WithNode,
+)
 from codecraft.elements.imports import ImportManager
 from codecraft.utils import IndentationManager
 
+_BLANK = BlankLineNode()
+
+
+@lru_cache(maxsize=None)
+def _load_black() -> Any:
+    """
+    Import black once per process.
+
+    Returns:
+        The black module, or None if it is not installed
+    """
+    try:
+        import black
+    except ImportError:
+        return None
+    return black
+
+
+@lru_cache(maxsize=None)
+def _black_mode(line_length: int) -> Any:
+    """
+    Get a shared black Mode for a line length.
+
+    Args:
+        line_length: Line length for formatting
+
+    Returns:
+        The black Mode instance
+    """
+    return _load_black().Mode(line_length=line_length)
+
+
+def _format_code(code: str, line_length: int) -> str:
+    """
+    Format code with black.
+
+    Args:
+        code: The code to format
+        line_length: Line length for formatting
+
+    Returns:
+        The formatted code, or the input unchanged if black is not installed
+    """
+    black = _load_black()
+    if black is None:
+        return code
+    formatted: str = black.format_str(code, mode=_black_mode(line_length))
+    return formatted
+
 
 class CodeBuilder:
     """
@@ -46,6 +107,9 @@ class CodeBuilder:
         self._import_manager = ImportManager()
         self._context_stack: List = []
 
+        # Source last checked by validate() and the syntax error it raised
+        self._validated: Optional[Tuple[str, Optional[SyntaxError]]] = None
+
     def __enter__(self) -> "CodeBuilder":
         """Enter the context."""
         return self
@@ -70,20 +134,22 @@ class CodeBuilder:
 
     def _add_node(self, node: Node):
         """Add a node to the current context or root."""
-        current = self._current_context()
-        if current and hasattr(current, "node") and current.node:
-            current.node.add_child(node)
+        # Read the stack directly; every context inherits ``node`` from
+        # BaseContext
+        stack = self._context_stack
+        parent = stack[-1].node if stack else None
+        if parent is not None:
+            parent.children.append(node)
         else:
             self._nodes.append(node)
 
     # Context managers for structural elements
-    @contextmanager
     def class_(
         self,
         name: str,
         bases: Optional[List[str]] = None,
         decorators: Optional[List[str]] = None,
-    ):
+    ) -> ClassContext:
         """
         Context manager for class definition.
 
@@ -92,14 +158,40 @@ class CodeBuilder:
             bases: List of base class names
             decorators: List of decorator strings
 
-        Yields:
+        Returns:
             ClassContext: The class context
         """
-        ctx = ClassContext(self, name, bases, decorators)
-        with ctx:
-            yield ctx
+        return ClassContext(self, name, bases, decorators)
+
+    def begin_class(
+        self,
+        name: str,
+        bases: Optional[List[str]] = None,
+        decorators: Optional[List[str]] = None,
+    ) -> ClassContext:
+        """
+        Open a class definition without a ``with`` block.
+
+        Code added until the matching end_class() goes into the class body.
+
+        Args:
+            name: Class name
+            bases: List of base class names
+            decorators: List of decorator strings
+
+        Returns:
+            ClassContext: The entered class context
+        """
+        return ClassContext(self, name, bases, decorators).__enter__()
+
+    def end_class(self) -> None:
+        """Close the class opened by the matching begin_class()."""
+        current = self._current_context()
+        if isinstance(current, ClassContext):
+            current.__exit__(None, None, None)
+        else:
+            raise RuntimeError("end_class() called without an open class")
 
-    @contextmanager
     def function(
         self,
         name: str,
@@ -107,7 +199,7 @@ class CodeBuilder:
         returns: Optional[str] = None,
         decorators: Optional[List[str]] = None,
         async_: bool = False,
-    ):
+    ) -> FunctionContext:
         """
         Context manager for function definition.
 
@@ -118,16 +210,13 @@ class CodeBuilder:
             decorators: List of decorator strings
             async_: Whether this is an async function
 
-        Yields:
+        Returns:
             FunctionContext: The function context
         """
-        ctx = FunctionContext(
+        return FunctionContext(
             self, name, params, returns, decorators, async_, is_method=False
         )
-        with ctx:
-            yield ctx
 
-    @contextmanager
     def method(
         self,
         name: str,
@@ -135,7 +224,7 @@ class CodeBuilder:
         returns: Optional[str] = None,
         decorators: Optional[List[str]] = None,
         async_: bool = False,
-    ):
+    ) -> FunctionContext:
         """
         Context manager for method definition.
 
@@ -146,69 +235,51 @@ class CodeBuilder:
             decorators: List of decorator strings
             async_: Whether this is an async method
 
-        Yields:
+        Returns:
             FunctionContext: The method context
         """
-        ctx = FunctionContext(
+        return FunctionContext(
             self, name, params, returns, decorators, async_, is_method=True
         )
-        with ctx:
-            yield ctx
 
     # Control flow context managers
-    @contextmanager
-    def if_(self, condition: str):
+    def if_(self, condition: str) -> ControlFlowContext:
         """
         Context manager for if statement.
 
         Args:
             condition: The if condition
 
-        Yields:
+        Returns:
             ControlFlowContext: The if context
         """
-        from codecraft.elements.control_flow import IfNode
-
         node = IfNode(condition, self._indent_manager.level)
-        ctx = ControlFlowContext(self, node)
-        with ctx:
-            yield ctx
+        return ControlFlowContext(self, node)
 
-    @contextmanager
-    def elif_(self, condition: str):
+    def elif_(self, condition: str) -> ControlFlowContext:
         """
         Context manager for elif statement.
 
         Args:
             condition: The elif condition
 
-        Yields:
+        Returns:
             ControlFlowContext: The elif context
         """
-        from codecraft.elements.control_flow import ElifNode
-
         node = ElifNode(condition, self._indent_manager.level)
-        ctx = ControlFlowContext(self, node)
-        with ctx:
-            yield ctx
+        return ControlFlowContext(self, node)
 
-    @contextmanager
-    def else_(self):
+    def else_(self) -> ControlFlowContext:
         """
         Context manager for else statement.
 
-        Yields:
+        Returns:
             ControlFlowContext: The else context
         """
-        from codecraft.elements.control_flow import ElseNode
-
         node = ElseNode(self._indent_manager.level)
-        ctx = ControlFlowContext(self, node)
-        with ctx:
-            yield ctx
+        return ControlFlowContext(self, node)
 
-    @contextmanager
-    def for_(self, target: str, iterable: str):
+    def for_(self, target: str, iterable: str) -> ControlFlowContext:
         """
         Context manager for for loop.
 
@@ -216,51 +287,38 @@ class CodeBuilder:
             target: Loop variable name
             iterable: Iterable expression
 
-        Yields:
+        Returns:
             ControlFlowContext: The for loop context
         """
-        from codecraft.elements.control_flow import ForNode
-
         node = ForNode(target, iterable, self._indent_manager.level)
-        ctx = ControlFlowContext(self, node)
-        with ctx:
-            yield ctx
+        return ControlFlowContext(self, node)
 
-    @contextmanager
-    def while_(self, condition: str):
+    def while_(self, condition: str) -> ControlFlowContext:
         """
         Context manager for while loop.
 
         Args:
             condition: Loop condition
 
-        Yields:
+        Returns:
             ControlFlowContext: The while loop context
         """
-        from codecraft.elements.control_flow import WhileNode
-
         node = WhileNode(condition, self._indent_manager.level)
-        ctx = ControlFlowContext(self, node)
-        with ctx:
-            yield ctx
+        return ControlFlowContext(self, node)
 
-    @contextmanager
-    def try_(self):
+    def try_(self) -> ControlFlowContext:
         """
         Context manager for try block.
 
-        Yields:
+        Returns:
             ControlFlowContext: The try context
         """
-        from codecraft.elements.control_flow import TryNode
-
         node = TryNode(self._indent_manager.level)
-        ctx = ControlFlowContext(self, node)
-        with ctx:
-            yield ctx
+        return ControlFlowContext(self, node)
 
-    @contextmanager
-    def except_(self, exception: Optional[str] = None, as_: Optional[str] = None):
+    def except_(
+        self, exception: Optional[str] = None, as_: Optional[str] = None
+    ) -> ControlFlowContext:
         """
         Context manager for except block.
 
@@ -268,33 +326,25 @@ class CodeBuilder:
             exception: Exception type to catch
             as_: Variable name to bind exception to
 
-        Yields:
+        Returns:
             ControlFlowContext: The except context
         """
-        from codecraft.elements.control_flow import ExceptNode
-
         node = ExceptNode(exception, as_, self._indent_manager.level)
-        ctx = ControlFlowContext(self, node)
-        with ctx:
-            yield ctx
+        return ControlFlowContext(self, node)
 
-    @contextmanager
-    def finally_(self):
+    def finally_(self) -> ControlFlowContext:
         """
         Context manager for finally block.
 
-        Yields:
+        Returns:
             ControlFlowContext: The finally context
         """
-        from codecraft.elements.control_flow import FinallyNode
-
         node = FinallyNode(self._indent_manager.level)
-        ctx = ControlFlowContext(self, node)
-        with ctx:
-            yield ctx
+        return ControlFlowContext(self, node)
 
-    @contextmanager
-    def with_(self, expression: str, as_: Optional[str] = None):
+    def with_(
+        self, expression: str, as_: Optional[str] = None
+    ) -> ControlFlowContext:
         """
         Context manager for with statement.
 
@@ -302,15 +352,11 @@ class CodeBuilder:
             expression: Context manager expression
             as_: Variable name to bind to
 
-        Yields:
+        Returns:
             ControlFlowContext: The with context
         """
-        from codecraft.elements.control_flow import WithNode
-
         node = WithNode(expression, as_, self._indent_manager.level)
-        ctx = ControlFlowContext(self, node)
-        with ctx:
-            yield ctx
+        return ControlFlowContext(self, node)
 
     # Direct code operations
     def line(self, code: str):
@@ -320,6 +366,10 @@ class CodeBuilder:
         Args:
             code: The code line
         """
+        # An empty line renders the same at any level, so share the blank node
+        if not code:
+            self._add_node(_BLANK)
+            return
         node = RawLineNode(code, self._indent_manager.level)
         self._add_node(node)
 
@@ -375,7 +425,7 @@ class CodeBuilder:
 
     def blank_line(self):
         """Add a single blank line."""
-        self._add_node(BlankLineNode())
+        self._add_node(_BLANK)
 
     def blank_lines(self, n: int):
         """
@@ -384,8 +434,12 @@ class CodeBuilder:
         Args:
             n: Number of blank lines to add
         """
-        for _ in range(n):
-            self.blank_line()
+        current = self._current_context()
+        if current is not None and current.node is not None:
+            target = current.node.children
+        else:
+            target = self._nodes
+        target.extend([_BLANK] * n)
 
     def attr(self, name: str, type_: str, default: Optional[str] = None):
         """
@@ -415,12 +469,12 @@ class CodeBuilder:
             items: Optional items to import from module
         """
         # If we're inside a context, add as a code line instead of to import manager
-        if self._current_context():
+        if self._context_stack:
             if items:
-                items_str = ", ".join(items)
-                self.line(f"from {module} import {items_str}")
+                code = f"from {module} import {', '.join(items)}"
             else:
-                self.line(f"import {module}")
+                code = f"import {module}"
+            self._add_node(RawLineNode(code, self._indent_manager.level))
         else:
             # Top-level imports go to the import manager
             if items:
@@ -440,14 +494,32 @@ class CodeBuilder:
             items: Items to import
         """
         # If we're inside a context, add as a code line instead of to import manager
-        if self._current_context():
-            items_str = ", ".join(items)
-            self.line(f"from {module} import {items_str}")
+        if self._context_stack:
+            code = f"from {module} import {', '.join(items)}"
+            self._add_node(RawLineNode(code, self._indent_manager.level))
         else:
             # Top-level imports go to the import manager
             self._import_manager.add_from_import(module, items)
 
     # Code generation
+    def _top_level_nodes(self) -> List[Node]:
+        """
+        Get the nodes that make up the file, in output order.
+
+        Returns:
+            Import nodes, the blank lines separating them from the body, and
+            the top-level body nodes
+        """
+        nodes = self._import_manager.get_import_nodes()
+
+        # Add blank lines after imports if we have them
+        if nodes and self._nodes:
+            nodes.append(_BLANK)
+            nodes.append(_BLANK)
+
+        nodes.extend(self._nodes)
+        return nodes
+
     def generate(self, format: bool = False, line_length: int = 88) -> str:
         """
         Generate the Python code as a string.
@@ -459,37 +531,82 @@ class CodeBuilder:
         Returns:
             The generated Python code
         """
-        lines = []
+        # Stream one top-level node at a time into a text buffer, so the lines
+        # of the whole tree are never alive at the same time as the result
+        buf = io.StringIO()
+        buf.writelines(self.generate_iter())
+        code = buf.getvalue()
+
+        # Format if requested
+        if format:
+            code = _format_code(code, line_length)
+
+        return code
+
+    def line_count(self, format: bool = False, line_length: int = 88) -> int:
+        """
+        Count the lines of the generated code.
 
-        # Add imports first
-        import_nodes = self._import_manager.get_import_nodes()
-        for imp in import_nodes:
-            lines.append(imp.render(self._indent_size, self._indent_char))
+        The options match generate(), whose output is what gets counted.
+        A builder holding a single blank line generates "" and counts as one
+        line; only a builder with nothing added counts as zero.
 
-        # Add blank lines after imports if we have them
-        if import_nodes and self._nodes:
-            lines.append("")
-            lines.append("")
+        Args:
+            format: Whether to count the black-formatted code
+            line_length: Line length for formatting
 
-        # Render all nodes - don't filter out blank lines (empty strings are valid)
-        for node in self._nodes:
-            rendered = node.render(self._indent_size, self._indent_char)
-            # Check for None instead of falsy to allow empty strings (blank lines)
-            if rendered is not None:
-                lines.append(rendered)
+        Returns:
+            Number of lines in generate(format, line_length), or 0 if nothing
+            was added
+        """
+        if not self._nodes and self._import_manager.is_empty():
+            return 0
+        # Counting separators avoids building the list that split() would
+        return self.generate(format, line_length).count("\n") + 1
 
-        code = "\n".join(lines)
+    def generate_iter(self) -> Iterator[str]:
+        """
+        Generate the unformatted Python code incrementally.
 
-        # Format if requested
-        if format:
-            try:
-                import black
+        Each chunk holds one top-level node, so the full source is never
+        materialized. Joining the chunks gives the same text as generate().
 
-                code = black.format_str(code, mode=black.Mode(line_length=line_length))
-            except ImportError:
-                pass  # black not installed, skip formatting
+        Yields:
+            Consecutive pieces of the generated code
+        """
+        out: List[str] = []
+        indent_size, indent_char = self._indent_size, self._indent_char
+        first = True
+        for node in self._top_level_nodes():
+            node.write(out, indent_size, indent_char)
+            chunk = "\n".join(out)
+            out.clear()
+            if first:
+                first = False
+                yield chunk
+            else:
+                yield "\n" + chunk
 
-        return code
+    def generate_into(
+        self, fp: TextIO, format: bool = False, line_length: int = 88
+    ) -> None:
+        """
+        Write the generated Python code to an open text file.
+
+        Without formatting, the output is streamed one top-level node at a
+        time so the whole file is never held in memory. Formatting needs the
+        complete source, so it falls back to generate().
+
+        Args:
+            fp: Text file (or any object with a ``write`` method)
+            format: Whether to format with black
+            line_length: Line length for formatting
+        """
+        if format and _load_black() is not None:
+            fp.write(self.generate(format, line_length))
+            return
+
+        fp.writelines(self.generate_iter())
 
     def save(self, filepath: str, format: bool = True, line_length: int = 88):
         """
@@ -500,9 +617,16 @@ class CodeBuilder:
             format: Whether to format with black
             line_length: Line length for formatting
         """
-        code = self.generate(format, line_length)
+        if format and _load_black() is not None:
+            # Format before opening the file, so a black failure leaves any
+            # existing file untouched
+            code = self.generate(format, line_length)
+            with open(filepath, "w") as f:
+                f.write(code)
+            return
+
         with open(filepath, "w") as f:
-            f.write(code)
+            self.generate_into(f)
 
     def validate(self, detailed: bool = False):
         """
@@ -516,16 +640,27 @@ class CodeBuilder:
         """
         code = self.generate()
 
-        try:
-            compile(code, "<string>", "exec")
+        # Reuse the last result only for identical source; comparing the text
+        # is far cheaper than compiling it again
+        if self._validated is not None and self._validated[0] == code:
+            error = self._validated[1]
+        else:
+            try:
+                # Unlike ast.parse, no Python-level AST objects are built
+                compile(code, "<codebuilder>", "exec", dont_inherit=True)
+                error = None
+            except SyntaxError as e:
+                error = e
+            self._validated = (code, error)
+
+        if error is None:
             if detailed:
                 return {"valid": True, "errors": [], "warnings": []}
             return True
-        except SyntaxError as e:
-            if detailed:
-                return {
-                    "valid": False,
-                    "errors": [f"Syntax error at line {e.lineno}: {e.msg}"],
-                    "warnings": [],
-                }
-            return False
+        if detailed:
+            return {
+                "valid": False,
+                "errors": [f"Syntax error at line {error.lineno}: {error.msg}"],
+                "warnings": [],
+            }
+        return False
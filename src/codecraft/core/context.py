@@ -1,6 +1,9 @@
 """Context managers for code generation."""
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from codecraft.elements.class_element import ClassNode
+from codecraft.elements.function_element import FunctionNode, MethodNode
 
 if TYPE_CHECKING:
     from codecraft.core.builder import CodeBuilder
@@ -17,7 +20,7 @@ class BaseContext:
             builder: The CodeBuilder instance
         """
         self.builder = builder
-        self.node = None
+        self.node: Any = None
 
     def __enter__(self) -> "BaseContext":
         """Enter the context."""
@@ -48,12 +51,12 @@ class ClassContext(BaseContext):
             decorators: Class decorators
         """
         super().__init__(builder)
-        from codecraft.elements.class_element import ClassNode
-
         self.node = ClassNode(name, bases, decorators, builder._indent_manager.level)
 
     def __enter__(self) -> "ClassContext":
         """Enter the class context."""
+        # The context may have been created at another depth than it is entered
+        self.node.indent_level = self.builder._indent_manager.level
         self.builder._add_node(self.node)  # Add node first
         self.builder._push_context(self)  # Then push context
         self.builder._indent_manager.increase()
@@ -111,8 +114,6 @@ class FunctionContext(BaseContext):
             is_method: Whether this is a method
         """
         super().__init__(builder)
-        from codecraft.elements.function_element import FunctionNode, MethodNode
-
         if is_method:
             self.node = MethodNode(
                 name, params, returns, decorators, async_, builder._indent_manager.level
@@ -124,6 +125,8 @@ class FunctionContext(BaseContext):
 
     def __enter__(self) -> "FunctionContext":
         """Enter the function context."""
+        # The context may have been created at another depth than it is entered
+        self.node.indent_level = self.builder._indent_manager.level
         self.builder._add_node(self.node)  # Add node first
         self.builder._push_context(self)  # Then push context
         self.builder._indent_manager.increase()
@@ -160,6 +163,8 @@ class ControlFlowContext(BaseContext):
 
     def __enter__(self) -> "ControlFlowContext":
         """Enter the control flow context."""
+        # The context may have been created at another depth than it is entered
+        self.node.indent_level = self.builder._indent_manager.level
         self.builder._add_node(self.node)  # Add node first
         self.builder._push_context(self)  # Then push context
         self.builder._indent_manager.increase()
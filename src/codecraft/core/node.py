@@ -1,7 +1,13 @@
 """Base Node class for all code elements."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
+
+from codecraft.utils.indentation import (
+    _DEFAULT_DEPTH,
+    _DEFAULT_INDENTS,
+    _indent_str,
+)
 
 
 class Node(ABC):
@@ -12,6 +18,10 @@ class Node(ABC):
     with proper indentation and formatting.
     """
 
+    # Subclasses that are created once per emitted line declare their own
+    # slots too, so they carry no per-instance __dict__
+    __slots__ = ("indent_level", "children")
+
     def __init__(self, indent_level: int = 0):
         """
         Initialize a Node.
@@ -22,7 +32,52 @@ class Node(ABC):
         self.indent_level = indent_level
         self.children: List[Node] = []
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Give subclasses that only implement render() a concrete write().
+
+        Such subclasses keep working, while one implementing neither method
+        still fails with a TypeError when it is instantiated.
+        """
+        super().__init_subclass__(**kwargs)
+        if (
+            getattr(cls.write, "__isabstractmethod__", False)
+            and cls.render is not Node.render
+        ):
+            cls.write = Node._write_rendered  # type: ignore[method-assign]
+
     @abstractmethod
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """
+        Write this node's lines into a shared output buffer.
+
+        Nodes append their lines (without trailing newlines) directly to
+        ``out`` and let children do the same, so no intermediate strings are
+        built while walking the tree.
+
+        Args:
+            out: Caller-owned list that receives the rendered lines
+            indent_size: Number of indent characters per level
+            indent_char: Character to use for indentation
+        """
+
+    def _write_rendered(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """
+        Write this node by splitting the output of render().
+
+        Used as write() for subclasses that only implement render().
+
+        Args:
+            out: Caller-owned list that receives the rendered lines
+            indent_size: Number of indent characters per level
+            indent_char: Character to use for indentation
+        """
+        out.extend(self.render(indent_size, indent_char).split("\n"))
+
     def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
         """
         Render this node as Python code.
@@ -34,7 +89,9 @@ class Node(ABC):
         Returns:
             The rendered Python code as a string
         """
-        pass
+        out: List[str] = []
+        self.write(out, indent_size, indent_char)
+        return "\n".join(out)
 
     def add_child(self, node: "Node") -> None:
         """
@@ -45,6 +102,34 @@ class Node(ABC):
         """
         self.children.append(node)
 
+    def _write_block(
+        self,
+        out: List[str],
+        header: str,
+        indent_size: int = 4,
+        indent_char: str = " ",
+    ) -> None:
+        """
+        Write a block statement: its header line, then its body.
+
+        Children are written one level deeper; an empty body becomes ``pass``.
+
+        Args:
+            out: Caller-owned list that receives the rendered lines
+            header: Header line without indentation (e.g. ``"if x:"``)
+            indent_size: Number of indent characters per level
+            indent_char: Character to use for indentation
+        """
+        out.append(self._get_indent(indent_size, indent_char) + header)
+
+        if not self.children:
+            body_indent = _indent_str(self.indent_level + 1, indent_size, indent_char)
+            out.append(f"{body_indent}pass")
+            return
+
+        for child in self.children:
+            child.write(out, indent_size, indent_char)
+
     def _get_indent(self, indent_size: int = 4, indent_char: str = " ") -> str:
         """
         Get the indentation string for this node.
@@ -56,12 +141,18 @@ class Node(ABC):
         Returns:
             The indentation string
         """
-        return indent_char * (indent_size * self.indent_level)
+        level = self.indent_level
+        # Fast path for the default 4-space style
+        if indent_size == 4 and indent_char == " " and 0 <= level < _DEFAULT_DEPTH:
+            return _DEFAULT_INDENTS[level]
+        return _indent_str(level, indent_size, indent_char)
 
 
 class RawLineNode(Node):
     """Node representing a raw line of code."""
 
+    __slots__ = ("_code", "_empty")
+
     def __init__(self, code: str, indent_level: int = 0):
         """
         Initialize a RawLineNode.
@@ -73,29 +164,62 @@ class RawLineNode(Node):
         super().__init__(indent_level)
         self.code = code
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the raw line with proper indentation."""
-        if not self.code.strip():
-            return ""
-        indent = self._get_indent(indent_size, indent_char)
-        return f"{indent}{self.code}"
+    @property
+    def code(self) -> str:
+        """The raw code line."""
+        return self._code
+
+    @code.setter
+    def code(self, code: str) -> None:
+        self._code = code
+        # Whitespace-only code renders as a blank line; decide that per value
+        self._empty = not code.strip()
+
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the raw line with proper indentation."""
+        if self._empty:
+            out.append("")
+        elif not self.indent_level:
+            # Top-level lines need no indent lookup
+            out.append(self._code)
+        else:
+            out.append(self._get_indent(indent_size, indent_char) + self._code)
 
 
 class BlankLineNode(Node):
     """Node representing a blank line."""
 
+    __slots__ = ()
+
+    # Blank lines carry no state, so every BlankLineNode() is one shared object
+    _instance: Optional["BlankLineNode"] = None
+
+    def __new__(cls) -> "BlankLineNode":
+        """Return the shared instance, creating it on first use."""
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            Node.__init__(instance, 0)
+            cls._instance = instance
+        return instance
+
     def __init__(self):
-        """Initialize a BlankLineNode."""
-        super().__init__(0)
+        """Initialize a BlankLineNode (already done once in ``__new__``)."""
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render a blank line."""
-        return ""
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write a blank line."""
+        out.append("")
 
 
 class CommentNode(Node):
     """Node representing a comment."""
 
+    __slots__ = ("_text", "_suffix")
+
     def __init__(self, text: str, indent_level: int = 0):
         """
         Initialize a CommentNode.
@@ -107,15 +231,32 @@ class CommentNode(Node):
         super().__init__(indent_level)
         self.text = text
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the comment."""
-        indent = self._get_indent(indent_size, indent_char)
-        return f"{indent}# {self.text}"
+    @property
+    def text(self) -> str:
+        """The comment text (without # prefix)."""
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        self._text = text
+        # Everything after the indentation only changes with the text
+        self._suffix = f"# {text}"
+
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the comment."""
+        if not self.indent_level:
+            out.append(self._suffix)
+        else:
+            out.append(self._get_indent(indent_size, indent_char) + self._suffix)
 
 
 class DocstringNode(Node):
     """Node representing a docstring."""
 
+    __slots__ = ("_text", "_lines", "_quoted")
+
     def __init__(self, text: str, indent_level: int = 0):
         """
         Initialize a DocstringNode.
@@ -127,17 +268,35 @@ class DocstringNode(Node):
         super().__init__(indent_level)
         self.text = text
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the docstring."""
+    @property
+    def text(self) -> str:
+        """The docstring text."""
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        self._text = text
+        # Quote and split whenever the text changes; writing only has to add
+        # the indentation
+        lines = text.split("\n")
+        self._lines: Optional[Tuple[str, ...]] = (
+            tuple(lines) if len(lines) > 1 else None
+        )
+        self._quoted = f'"""{text}"""'
+
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the docstring."""
         indent = self._get_indent(indent_size, indent_char)
 
         # Single line docstring
-        if "\n" not in self.text:
-            return f'{indent}"""{self.text}"""'
-
-        # Multi-line docstring
-        lines = [f'{indent}"""']
-        for line in self.text.split("\n"):
-            lines.append(f"{indent}{line}")
-        lines.append(f'{indent}"""')
-        return "\n".join(lines)
+        if self._lines is None:
+            out.append(indent + self._quoted)
+            return
+
+        # Multi-line docstring: one buffer entry per line, as write() requires
+        quotes = indent + '"""'
+        out.append(quotes)
+        out.extend([indent + line for line in self._lines])
+        out.append(quotes)
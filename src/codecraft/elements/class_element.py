@@ -1,9 +1,10 @@
 """Class definition nodes."""
 
 from typing import List, Optional
-from codecraft.core.node import Node
+from codecraft.core.node import DocstringNode, Node
+from codecraft.utils.indentation import _indent_str
 from codecraft.utils import format_bases
-from codecraft.elements.decorators import render_decorators
+from codecraft.elements.decorators import normalize_decorators
 
 
 class AttributeNode(Node):
@@ -30,13 +31,16 @@ class AttributeNode(Node):
         self.type_hint = type_hint
         self.default = default
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the attribute."""
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the attribute."""
         indent = self._get_indent(indent_size, indent_char)
 
         if self.default:
-            return f"{indent}{self.name}: {self.type_hint} = {self.default}"
-        return f"{indent}{self.name}: {self.type_hint}"
+            out.append(f"{indent}{self.name}: {self.type_hint} = {self.default}")
+        else:
+            out.append(f"{indent}{self.name}: {self.type_hint}")
 
 
 class ClassNode(Node):
@@ -64,6 +68,7 @@ class ClassNode(Node):
         self.decorators = decorators or []
         self.attributes: List[AttributeNode] = []
         self.docstring: Optional[str] = None
+        self._docstring_node: Optional[DocstringNode] = None
 
     def add_attribute(
         self, name: str, type_hint: str, default: Optional[str] = None
@@ -87,47 +92,56 @@ class ClassNode(Node):
             text: Docstring text
         """
         self.docstring = text
+        # Quoting and line splitting happen once, here
+        self._docstring_node = DocstringNode(text, self.indent_level + 1)
+
+    def _get_docstring_node(self, text: str) -> DocstringNode:
+        """
+        Get the docstring node, rebuilding it if it no longer matches.
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the class definition."""
-        lines = []
+        ``docstring`` and ``indent_level`` are public attributes, so they may
+        have been changed directly since set_docstring() was called.
+
+        Args:
+            text: The current docstring text, already checked to be non-empty
+
+        Returns:
+            The DocstringNode for the current docstring text and level
+        """
+        node = self._docstring_node
+        level = self.indent_level + 1
+        if node is None or node.text != text or node.indent_level != level:
+            node = self._docstring_node = DocstringNode(text, level)
+        return node
+
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the class definition."""
         indent = self._get_indent(indent_size, indent_char)
-        body_indent = indent_char * (indent_size * (self.indent_level + 1))
 
         # Render decorators
         if self.decorators:
-            dec_lines = render_decorators(
-                self.decorators, self.indent_level, indent_size, indent_char
-            )
-            lines.extend(dec_lines)
+            out.extend([indent + dec for dec in normalize_decorators(self.decorators)])
 
         # Class definition line
-        bases_str = format_bases(self.bases)
-        lines.append(f"{indent}class {self.name}{bases_str}:")
+        # Bases are public and mutable, so format them at write time
+        out.append(f"{indent}class {self.name}{format_bases(self.bases)}:")
 
         # Docstring - render BEFORE attributes (Python convention)
-        if self.docstring:
-            if "\n" not in self.docstring:
-                lines.append(f'{body_indent}"""{self.docstring}"""')
-            else:
-                lines.append(f'{body_indent}"""')
-                for line in self.docstring.split("\n"):
-                    lines.append(f"{body_indent}{line}")
-                lines.append(f'{body_indent}"""')
+        docstring = self.docstring
+        if docstring:
+            self._get_docstring_node(docstring).write(out, indent_size, indent_char)
 
         # Attributes - render AFTER docstring
         for attr in self.attributes:
-            lines.append(attr.render(indent_size, indent_char))
+            attr.write(out, indent_size, indent_char)
 
         # Children (methods, nested classes, etc.)
         for child in self.children:
-            rendered = child.render(indent_size, indent_char)
-            # Don't filter out blank lines (empty strings are valid)
-            if rendered is not None:
-                lines.append(rendered)
+            child.write(out, indent_size, indent_char)
 
         # If class is empty, add pass
         if not self.docstring and not self.attributes and not self.children:
-            lines.append(f"{body_indent}pass")
-
-        return "\n".join(lines)
+            body_indent = _indent_str(self.indent_level + 1, indent_size, indent_char)
+            out.append(f"{body_indent}pass")
@@ -1,6 +1,6 @@
 """Control flow statement nodes."""
 
-from typing import Optional
+from typing import List, Optional
 from codecraft.core.node import Node
 
 
@@ -18,26 +18,11 @@ class IfNode(Node):
         super().__init__(indent_level)
         self.condition = condition
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the if statement."""
-        lines = []
-        indent = self._get_indent(indent_size, indent_char)
-
-        lines.append(f"{indent}if {self.condition}:")
-
-        # Render children
-        for child in self.children:
-            rendered = child.render(indent_size, indent_char)
-            # Don't filter out blank lines (empty strings are valid)
-            if rendered is not None:
-                lines.append(rendered)
-
-        # If no children, add pass
-        if not self.children:
-            body_indent = indent_char * (indent_size * (self.indent_level + 1))
-            lines.append(f"{body_indent}pass")
-
-        return "\n".join(lines)
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the if statement."""
+        self._write_block(out, f"if {self.condition}:", indent_size, indent_char)
 
 
 class ElifNode(Node):
@@ -54,26 +39,11 @@ class ElifNode(Node):
         super().__init__(indent_level)
         self.condition = condition
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the elif statement."""
-        lines = []
-        indent = self._get_indent(indent_size, indent_char)
-
-        lines.append(f"{indent}elif {self.condition}:")
-
-        # Render children
-        for child in self.children:
-            rendered = child.render(indent_size, indent_char)
-            # Don't filter out blank lines (empty strings are valid)
-            if rendered is not None:
-                lines.append(rendered)
-
-        # If no children, add pass
-        if not self.children:
-            body_indent = indent_char * (indent_size * (self.indent_level + 1))
-            lines.append(f"{body_indent}pass")
-
-        return "\n".join(lines)
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the elif statement."""
+        self._write_block(out, f"elif {self.condition}:", indent_size, indent_char)
 
 
 class ElseNode(Node):
@@ -88,26 +58,11 @@ class ElseNode(Node):
         """
         super().__init__(indent_level)
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the else statement."""
-        lines = []
-        indent = self._get_indent(indent_size, indent_char)
-
-        lines.append(f"{indent}else:")
-
-        # Render children
-        for child in self.children:
-            rendered = child.render(indent_size, indent_char)
-            # Don't filter out blank lines (empty strings are valid)
-            if rendered is not None:
-                lines.append(rendered)
-
-        # If no children, add pass
-        if not self.children:
-            body_indent = indent_char * (indent_size * (self.indent_level + 1))
-            lines.append(f"{body_indent}pass")
-
-        return "\n".join(lines)
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the else statement."""
+        self._write_block(out, "else:", indent_size, indent_char)
 
 
 class ForNode(Node):
@@ -126,26 +81,12 @@ class ForNode(Node):
         self.target = target
         self.iterable = iterable
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the for loop."""
-        lines = []
-        indent = self._get_indent(indent_size, indent_char)
-
-        lines.append(f"{indent}for {self.target} in {self.iterable}:")
-
-        # Render children
-        for child in self.children:
-            rendered = child.render(indent_size, indent_char)
-            # Don't filter out blank lines (empty strings are valid)
-            if rendered is not None:
-                lines.append(rendered)
-
-        # If no children, add pass
-        if not self.children:
-            body_indent = indent_char * (indent_size * (self.indent_level + 1))
-            lines.append(f"{body_indent}pass")
-
-        return "\n".join(lines)
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the for loop."""
+        header = f"for {self.target} in {self.iterable}:"
+        self._write_block(out, header, indent_size, indent_char)
 
 
 class WhileNode(Node):
@@ -162,26 +103,11 @@ class WhileNode(Node):
         super().__init__(indent_level)
         self.condition = condition
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the while loop."""
-        lines = []
-        indent = self._get_indent(indent_size, indent_char)
-
-        lines.append(f"{indent}while {self.condition}:")
-
-        # Render children
-        for child in self.children:
-            rendered = child.render(indent_size, indent_char)
-            # Don't filter out blank lines (empty strings are valid)
-            if rendered is not None:
-                lines.append(rendered)
-
-        # If no children, add pass
-        if not self.children:
-            body_indent = indent_char * (indent_size * (self.indent_level + 1))
-            lines.append(f"{body_indent}pass")
-
-        return "\n".join(lines)
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the while loop."""
+        self._write_block(out, f"while {self.condition}:", indent_size, indent_char)
 
 
 class TryNode(Node):
@@ -196,26 +122,11 @@ class TryNode(Node):
         """
         super().__init__(indent_level)
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the try block."""
-        lines = []
-        indent = self._get_indent(indent_size, indent_char)
-
-        lines.append(f"{indent}try:")
-
-        # Render children
-        for child in self.children:
-            rendered = child.render(indent_size, indent_char)
-            # Don't filter out blank lines (empty strings are valid)
-            if rendered is not None:
-                lines.append(rendered)
-
-        # If no children, add pass
-        if not self.children:
-            body_indent = indent_char * (indent_size * (self.indent_level + 1))
-            lines.append(f"{body_indent}pass")
-
-        return "\n".join(lines)
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the try block."""
+        self._write_block(out, "try:", indent_size, indent_char)
 
 
 class ExceptNode(Node):
@@ -239,33 +150,18 @@ class ExceptNode(Node):
         self.exception = exception
         self.as_ = as_
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the except block."""
-        lines = []
-        indent = self._get_indent(indent_size, indent_char)
-
-        # Build except line
-        except_line = f"{indent}except"
-        if self.exception:
-            except_line += f" {self.exception}"
-            if self.as_:
-                except_line += f" as {self.as_}"
-        except_line += ":"
-        lines.append(except_line)
-
-        # Render children
-        for child in self.children:
-            rendered = child.render(indent_size, indent_char)
-            # Don't filter out blank lines (empty strings are valid)
-            if rendered is not None:
-                lines.append(rendered)
-
-        # If no children, add pass
-        if not self.children:
-            body_indent = indent_char * (indent_size * (self.indent_level + 1))
-            lines.append(f"{body_indent}pass")
-
-        return "\n".join(lines)
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the except block."""
+        # One f-string per shape, so no partial headers are built
+        if not self.exception:
+            header = "except:"
+        elif self.as_:
+            header = f"except {self.exception} as {self.as_}:"
+        else:
+            header = f"except {self.exception}:"
+        self._write_block(out, header, indent_size, indent_char)
 
 
 class FinallyNode(Node):
@@ -280,26 +176,11 @@ class FinallyNode(Node):
         """
         super().__init__(indent_level)
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the finally block."""
-        lines = []
-        indent = self._get_indent(indent_size, indent_char)
-
-        lines.append(f"{indent}finally:")
-
-        # Render children
-        for child in self.children:
-            rendered = child.render(indent_size, indent_char)
-            # Don't filter out blank lines (empty strings are valid)
-            if rendered is not None:
-                lines.append(rendered)
-
-        # If no children, add pass
-        if not self.children:
-            body_indent = indent_char * (indent_size * (self.indent_level + 1))
-            lines.append(f"{body_indent}pass")
-
-        return "\n".join(lines)
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the finally block."""
+        self._write_block(out, "finally:", indent_size, indent_char)
 
 
 class WithNode(Node):
@@ -320,28 +201,12 @@ class WithNode(Node):
         self.expression = expression
         self.as_ = as_
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the with statement."""
-        lines = []
-        indent = self._get_indent(indent_size, indent_char)
-
-        # Build with line
-        with_line = f"{indent}with {self.expression}"
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the with statement."""
         if self.as_:
-            with_line += f" as {self.as_}"
-        with_line += ":"
-        lines.append(with_line)
-
-        # Render children
-        for child in self.children:
-            rendered = child.render(indent_size, indent_char)
-            # Don't filter out blank lines (empty strings are valid)
-            if rendered is not None:
-                lines.append(rendered)
-
-        # If no children, add pass
-        if not self.children:
-            body_indent = indent_char * (indent_size * (self.indent_level + 1))
-            lines.append(f"{body_indent}pass")
-
-        return "\n".join(lines)
+            header = f"with {self.expression} as {self.as_}:"
+        else:
+            header = f"with {self.expression}:"
+        self._write_block(out, header, indent_size, indent_char)
@@ -1,7 +1,8 @@
 """Decorator support for classes and functions."""
 
-from typing import List
+from typing import List, Tuple
 from codecraft.core.node import Node
+from codecraft.utils.indentation import _indent_str
 
 
 class DecoratorNode(Node):
@@ -19,10 +20,25 @@ class DecoratorNode(Node):
         # Ensure decorator starts with @
         self.name = name if name.startswith("@") else f"@{name}"
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the decorator."""
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the decorator."""
         indent = self._get_indent(indent_size, indent_char)
-        return f"{indent}{self.name}"
+        out.append(f"{indent}{self.name}")
+
+
+def normalize_decorators(decorators: List[str]) -> Tuple[str, ...]:
+    """
+    Ensure every decorator string starts with ``@``.
+
+    Args:
+        decorators: List of decorator strings
+
+    Returns:
+        Tuple of decorator strings with the ``@`` prefix
+    """
+    return tuple(dec if dec.startswith("@") else f"@{dec}" for dec in decorators)
 
 
 def render_decorators(
@@ -43,8 +59,6 @@ def render_decorators(
     Returns:
         List of rendered decorator lines
     """
-    lines = []
-    for dec in decorators:
-        node = DecoratorNode(dec, indent_level)
-        lines.append(node.render(indent_size, indent_char))
-    return lines
+    # Same formatting as DecoratorNode, without a node per decorator
+    indent = _indent_str(indent_level, indent_size, indent_char)
+    return [indent + dec for dec in normalize_decorators(decorators)]
@@ -1,9 +1,10 @@
 """Function and method definition nodes."""
 
 from typing import List, Optional
-from codecraft.core.node import Node
+from codecraft.core.node import DocstringNode, Node
+from codecraft.utils.indentation import _indent_str
 from codecraft.utils import format_params, format_return_type
-from codecraft.elements.decorators import render_decorators
+from codecraft.elements.decorators import normalize_decorators
 
 
 class FunctionNode(Node):
@@ -36,6 +37,7 @@ class FunctionNode(Node):
         self.decorators = decorators or []
         self.async_ = async_
         self.docstring: Optional[str] = None
+        self._docstring_node: Optional[DocstringNode] = None
 
     def set_docstring(self, text: str) -> None:
         """
@@ -45,49 +47,62 @@ class FunctionNode(Node):
             text: Docstring text
         """
         self.docstring = text
+        # Quoting and line splitting happen once, here
+        self._docstring_node = DocstringNode(text, self.indent_level + 1)
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the function definition."""
-        lines = []
+    def _get_docstring_node(self, text: str) -> DocstringNode:
+        """
+        Get the docstring node, rebuilding it if it no longer matches.
+
+        ``docstring`` and ``indent_level`` are public attributes, so they may
+        have been changed directly since set_docstring() was called.
+
+        Args:
+            text: The current docstring text, already checked to be non-empty
+
+        Returns:
+            The DocstringNode for the current docstring text and level
+        """
+        node = self._docstring_node
+        level = self.indent_level + 1
+        if node is None or node.text != text or node.indent_level != level:
+            node = self._docstring_node = DocstringNode(text, level)
+        return node
+
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the function definition."""
         indent = self._get_indent(indent_size, indent_char)
-        body_indent = indent_char * (indent_size * (self.indent_level + 1))
 
         # Render decorators
         if self.decorators:
-            dec_lines = render_decorators(
-                self.decorators, self.indent_level, indent_size, indent_char
-            )
-            lines.extend(dec_lines)
+            out.extend([indent + dec for dec in normalize_decorators(self.decorators)])
 
         # Function definition line
+        # The signature is public and mutable, so format it at write time
         async_prefix = "async " if self.async_ else ""
         params_str = format_params(self.params)
         return_str = format_return_type(self.returns)
-        lines.append(
-            f"{indent}{async_prefix}def {self.name}({params_str}){return_str}:"
-        )
+        out.append(f"{indent}{async_prefix}def {self.name}({params_str}){return_str}:")
 
         # Docstring
-        if self.docstring:
-            if "\n" not in self.docstring:
-                lines.append(f'{body_indent}"""{self.docstring}"""')
-            else:
-                lines.append(f'{body_indent}"""')
-                for line in self.docstring.split("\n"):
-                    lines.append(f"{body_indent}{line}")
-                lines.append(f'{body_indent}"""')
+        docstring = self.docstring
+        if docstring:
+            self._get_docstring_node(docstring).write(out, indent_size, indent_char)
 
         # Body (children)
         for child in self.children:
-            rendered = child.render(indent_size, indent_char)
-            if rendered:
-                lines.append(rendered)
+            start = len(out)
+            child.write(out, indent_size, indent_char)
+            # Children that render to a single empty line are dropped
+            if len(out) == start + 1 and not out[start]:
+                out.pop()
 
         # If function is empty, add pass
         if not self.docstring and not self.children:
-            lines.append(f"{body_indent}pass")
-
-        return "\n".join(lines)
+            body_indent = _indent_str(self.indent_level + 1, indent_size, indent_char)
+            out.append(f"{body_indent}pass")
 
 
 class MethodNode(FunctionNode):
@@ -117,10 +132,13 @@ class MethodNode(FunctionNode):
             async_: Whether this is an async method
             indent_level: Indentation level (default 1 for class methods)
         """
-        # Ensure 'self' is in params if not provided
+        # Ensure 'self' is in params if not provided. Compare the bare name of
+        # the first parameter so names like 'myself' or 'cls_name' don't count
         if not params:
             params = ["self"]
-        elif "self" not in params[0] and "cls" not in params[0]:
-            params = ["self"] + params
+        else:
+            first = params[0].split(":", 1)[0].split("=", 1)[0].strip()
+            if first not in ("self", "cls"):
+                params = ["self"] + params
 
         super().__init__(name, params, returns, decorators, async_, indent_level)
@@ -1,6 +1,7 @@
 """Import statement nodes."""
 
-from typing import List, Optional, Set
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 from codecraft.core.node import Node
 
 
@@ -19,11 +20,14 @@ class ImportNode(Node):
         self.module = module
         self.alias = alias
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the import statement."""
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the import statement."""
         if self.alias:
-            return f"import {self.module} as {self.alias}"
-        return f"import {self.module}"
+            out.append(f"import {self.module} as {self.alias}")
+        else:
+            out.append(f"import {self.module}")
 
     def __eq__(self, other) -> bool:
         """Check equality for deduplication."""
@@ -51,10 +55,12 @@ class FromImportNode(Node):
         self.module = module
         self.items = items if isinstance(items, list) else [items]
 
-    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
-        """Render the from-import statement."""
+    def write(
+        self, out: List[str], indent_size: int = 4, indent_char: str = " "
+    ) -> None:
+        """Write the from-import statement."""
         items_str = ", ".join(self.items)
-        return f"from {self.module} import {items_str}"
+        out.append(f"from {self.module} import {items_str}")
 
     def __eq__(self, other) -> bool:
         """Check equality for deduplication."""
@@ -64,7 +70,9 @@ class FromImportNode(Node):
 
     def __hash__(self) -> int:
         """Hash for use in sets."""
-        return hash((self.module, tuple(sorted(self.items))))
+        # Order-insensitive like __eq__; a frozenset needs no sort, and items
+        # is a public list, so the hash is taken from its current contents
+        return hash((self.module, frozenset(self.items)))
 
 
 class ImportManager:
@@ -72,8 +80,10 @@ class ImportManager:
 
     def __init__(self):
         """Initialize the ImportManager."""
-        self._imports: Set[ImportNode] = set()
-        self._from_imports: Set[FromImportNode] = set()
+        # (module, alias) keys; nodes are only built when imports are rendered
+        self._imports: Dict[Tuple[str, Optional[str]], None] = {}
+        # module -> imported names; dicts keep first-seen order for stable output
+        self._from_imports: Dict[str, Dict[str, None]] = {}
 
     def add_import(self, module: str, alias: Optional[str] = None) -> None:
         """
@@ -83,7 +93,7 @@ class ImportManager:
             module: The module to import
             alias: Optional alias
         """
-        self._imports.add(ImportNode(module, alias))
+        self._imports[(module, alias)] = None
 
     def add_from_import(self, module: str, items: List[str]) -> None:
         """
@@ -93,20 +103,12 @@ class ImportManager:
             module: The module to import from
             items: Items to import
         """
-        # Check if we already have a from-import for this module
-        existing = None
-        for imp in self._from_imports:
-            if imp.module == module:
-                existing = imp
-                break
-
-        if existing:
-            # Merge items
-            self._from_imports.remove(existing)
-            merged_items = list(set(existing.items + items))
-            self._from_imports.add(FromImportNode(module, merged_items))
-        else:
-            self._from_imports.add(FromImportNode(module, items))
+        # A single name may be passed as a plain string, as FromImportNode allows
+        if isinstance(items, str):
+            items = [items]
+        # Merge into any existing from-import for this module
+        names = self._from_imports.setdefault(module, {})
+        names.update(dict.fromkeys(items))
 
     def get_import_nodes(self) -> List[Node]:
         """
@@ -115,17 +117,28 @@ class ImportManager:
         Returns:
             List of import nodes sorted by module name
         """
-        all_imports = []
-
-        # Sort regular imports
-        sorted_imports = sorted(self._imports, key=lambda x: x.module)
-        all_imports.extend(sorted_imports)
+        # Regular imports first, then from-imports; nodes are built only now
+        all_imports: List[Node] = [
+            ImportNode(module, alias)
+            for module, alias in sorted(self._imports, key=itemgetter(0))
+        ]
+        from_imports = self._from_imports
+        all_imports.extend(
+            [
+                FromImportNode(module, list(from_imports[module]))
+                for module in sorted(from_imports)
+            ]
+        )
+        return all_imports
 
-        # Sort from-imports
-        sorted_from_imports = sorted(self._from_imports, key=lambda x: x.module)
-        all_imports.extend(sorted_from_imports)
+    def is_empty(self) -> bool:
+        """
+        Check whether any imports have been added.
 
-        return all_imports
+        Returns:
+            True if get_import_nodes() would return no nodes
+        """
+        return not self._imports and not self._from_imports
 
     def clear(self) -> None:
         """Clear all imports."""
@@ -1,6 +1,6 @@
 """Utility functions for code generation."""
 
-from typing import List, Optional
+from typing import Any, List, Optional
 
 
 def format_params(params: List[str]) -> str:
@@ -61,18 +61,23 @@ def format_bases(bases: List[str]) -> str:
     return ""
 
 
-def ensure_list(value) -> List:
+def ensure_list(value: Any) -> List[Any]:
     """
     Ensure a value is a list.
 
     Args:
-        value: A value that might be a list, None, or a single item
+        value: A value that might be a list, tuple, None, or a single item
 
     Returns:
         A list containing the value(s)
     """
     if value is None:
         return []
+    # Exact type checks first; isinstance only runs for list subclasses
+    if type(value) is list:
+        return value
+    if type(value) is tuple:
+        return list(value)
     if isinstance(value, list):
         return value
     return [value]
@@ -1,9 +1,31 @@
 """Indentation management for code generation."""
 
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Generator
 
 
+# Precomputed indents for the default style (4 spaces), looked up by level
+_DEFAULT_DEPTH = 32
+_DEFAULT_INDENTS = tuple(" " * (4 * level) for level in range(_DEFAULT_DEPTH))
+
+
+@lru_cache(maxsize=256)
+def _indent_str(level: int, size: int, char: str) -> str:
+    """
+    Get the indentation string for a level, built once per distinct key.
+
+    Args:
+        level: Indentation level
+        size: Number of indent characters per level
+        char: Character to use for indentation
+
+    Returns:
+        The indentation string
+    """
+    return char * (size * level)
+
+
 class IndentationManager:
     """
     Manages indentation levels for code generation.
@@ -31,7 +53,7 @@ class IndentationManager:
         Returns:
             String of indentation characters for current level
         """
-        return self.char * (self.size * self.level)
+        return _indent_str(self.level, self.size, self.char)
 
     def increase(self) -> None:
         """Increase the indentation level by one."""
@@ -1,6 +1,11 @@
 """Tests for the core CodeBuilder class."""
 
+import io
+
+import pytest
+
 from codecraft import CodeBuilder
+from codecraft.core.node import RawLineNode
 
 
 def test_codebuilder_creation():
@@ -134,6 +139,29 @@ def test_blank_lines():
     assert len(lines) >= 3
 
 
+def test_line_count():
+    """Test that line_count() matches the generated lines."""
+    code = CodeBuilder()
+    assert code.line_count() == 0
+
+    code.line("x = 1")
+    code.blank_line()
+    with code.if_("x"):
+        code.docstring("Line 1\nLine 2")
+
+    assert code.line_count() == len(code.generate().split("\n"))
+
+
+def test_line_count_of_blank_lines():
+    """Test that blank lines count even when they generate an empty string."""
+    code = CodeBuilder()
+    code.blank_lines(1)
+    assert code.line_count() == 1
+
+    code.blank_lines(1)
+    assert code.line_count() == 2
+
+
 def test_indentation():
     """Test proper indentation."""
     with CodeBuilder(indent_size=2) as code:
@@ -160,6 +188,63 @@ def test_validation_invalid():
     assert code.validate() is False
 
 
+def test_validation_reports_compile_errors():
+    """Test that errors raised only by the compiler are reported."""
+    with CodeBuilder() as code:
+        code.return_("1")
+
+    assert code.validate() is False
+
+
+def test_validation_follows_changes():
+    """Test that repeated validation tracks later edits."""
+    code = CodeBuilder()
+    code.line("def invalid syntax")
+    assert code.validate() is False
+    assert code.validate(detailed=True)["errors"]
+
+    code = CodeBuilder()
+    code.line("x = 1")
+    assert code.validate() is True
+    code.line("def invalid syntax")
+    assert code.validate() is False
+
+
+def test_validation_sees_direct_node_changes():
+    """Test that validate() never reuses a result for changed source."""
+    with CodeBuilder() as code:
+        with code.function("f") as func:
+            code.line("return 1")
+
+    assert code.validate() is True
+    func.node.children.append(RawLineNode("return (", 1))
+    assert code.validate() is False
+    func.node.children.pop()
+    assert code.validate() is True
+
+
+def test_begin_end_class_matches_with_block():
+    """Test that begin_class()/end_class() produce the same code as class_()."""
+    with_block = CodeBuilder()
+    with with_block.class_("Point", bases=["Base"]):
+        with_block.attr("x", "int")
+    with_block.line("p = Point()")
+
+    explicit = CodeBuilder()
+    explicit.begin_class("Point", bases=["Base"])
+    explicit.attr("x", "int")
+    explicit.end_class()
+    explicit.line("p = Point()")
+
+    assert explicit.generate() == with_block.generate()
+
+
+def test_end_class_without_open_class():
+    """Test that end_class() outside a class raises."""
+    with pytest.raises(RuntimeError):
+        CodeBuilder().end_class()
+
+
 def test_nested_classes():
     """Test nested class definitions."""
     with CodeBuilder() as code:
@@ -180,3 +265,133 @@ def test_async_function():
 
     result = code.generate()
     assert "async def fetch(url: str):" in result
+
+
+def test_blank_lines_inside_context():
+    """Test that blank_lines() adds to the current context."""
+    with CodeBuilder() as code:
+        with code.class_("MyClass"):
+            code.attr("x", "int")
+            code.blank_lines(2)
+            code.attr("y", "int")
+        code.blank_lines(1)
+        code.line("z = 1")
+
+    result = code.generate()
+    assert result == "class MyClass:\n    x: int\n    y: int\n\n\n\nz = 1"
+
+
+def test_generate_sees_direct_node_changes():
+    """Test that changes made through context nodes show up in the output."""
+    with CodeBuilder() as code:
+        with code.class_("A") as cls:
+            code.attr("x", "int")
+        with code.function("f") as func:
+            code.line("return 1")
+
+    assert code.generate().startswith("class A:")
+    assert code.validate() is True
+
+    cls.node.bases.append("Base")
+    cls.node.decorators.append("dataclass")
+    assert code.generate().startswith("@dataclass\nclass A(Base):")
+
+    func.node.children.append(RawLineNode("return (", 1))
+    assert code.validate() is False
+
+
+def test_context_methods_return_context_objects():
+    """Test that structural helpers return their context directly."""
+    code = CodeBuilder()
+    ctx = code.if_("x")
+    with ctx as entered:
+        code.line("pass")
+
+    assert entered is ctx
+    assert code.generate() == "if x:\n    pass"
+
+
+def test_contexts_take_the_depth_they_are_entered_at():
+    """Test that a context created before its enclosing block is indented."""
+    code = CodeBuilder()
+    check = code.if_("a")
+    run = code.method("run")
+    with code.class_("K"):
+        with run:
+            with check:
+                code.line("pass")
+
+    assert code.generate() == (
+        "class K:\n    def run(self):\n        if a:\n            pass"
+    )
+
+
+def test_generate_into_matches_generate():
+    """Test that streaming output matches generate()."""
+    with CodeBuilder() as code:
+        code.add_import("os")
+        with code.function("main"):
+            code.line("print(os.getcwd())")
+        code.blank_line()
+        code.line("main()")
+
+    buffer = io.StringIO()
+    code.generate_into(buffer)
+    assert buffer.getvalue() == code.generate()
+
+
+def test_save_writes_generated_code(tmp_path):
+    """Test that save() writes the generated code to disk."""
+    with CodeBuilder() as code:
+        code.line("x = 1")
+        code.line("y = 2")
+
+    path = tmp_path / "out.py"
+    code.save(str(path), format=False)
+    assert path.read_text() == code.generate()
+
+
+def test_save_keeps_existing_file_when_formatting_fails(tmp_path, monkeypatch):
+    """Test that a formatter error does not truncate the target file."""
+    from codecraft.core import builder
+
+    def fail(code, line_length):
+        raise ValueError("cannot format")
+
+    monkeypatch.setattr(builder, "_load_black", lambda: object())
+    monkeypatch.setattr(builder, "_format_code", fail)
+
+    path = tmp_path / "out.py"
+    path.write_text("ORIGINAL CONTENT\n")
+    code = CodeBuilder()
+    code.line("x = 1")
+    with pytest.raises(ValueError):
+        code.save(str(path))
+    assert path.read_text() == "ORIGINAL CONTENT\n"
+
+
+def test_generate_iter_joins_to_generate():
+    """Test that the incremental chunks join to the generated code."""
+    with CodeBuilder() as code:
+        code.add_from_import("typing", ["List"])
+        with code.class_("A"):
+            code.attr("items", "List[int]")
+        code.line("a = A()")
+
+    chunks = list(code.generate_iter())
+    assert len(chunks) > 1
+    assert "".join(chunks) == code.generate()
+
+
+def test_empty_line_matches_blank_line():
+    """Test that line("") renders like blank_line() at any depth."""
+    with CodeBuilder() as code:
+        code.line("")
+        with code.class_("A"):
+            code.attr("x", "int")
+            code.line("")
+            with code.method("m"):
+                code.line("")
+                code.line("pass")
+
+    assert code.generate() == "\nclass A:\n    x: int\n\n    def m(self):\n        pass"
@@ -1,6 +1,10 @@
 """Tests for Node classes."""
 
+import pytest
+
+from codecraft.core import Node
 from codecraft.core.node import RawLineNode, BlankLineNode, CommentNode, DocstringNode
+from codecraft.elements.function_element import FunctionNode
 
 
 def test_raw_line_node():
@@ -41,3 +45,112 @@ def test_docstring_node_multi_line():
     assert '"""' in result
     assert "Line 1" in result
     assert "Line 2" in result
+
+
+def test_write_appends_to_shared_buffer():
+    """Test that write() appends lines to a caller-owned list."""
+    out = ["existing"]
+    RawLineNode("x = 1", indent_level=1).write(out)
+    DocstringNode("Line 1\nLine 2", indent_level=0).write(out)
+    assert out == ["existing", "    x = 1", '"""', "Line 1", "Line 2", '"""']
+
+
+def test_render_joins_written_lines():
+    """Test that render() matches the lines produced by write()."""
+    node = DocstringNode("Line 1\nLine 2", indent_level=1)
+    out = []
+    node.write(out)
+    assert node.render() == "\n".join(out)
+
+
+def test_indent_strings_are_shared():
+    """Test that nodes at the same level reuse one indent string."""
+    a = CommentNode("a", indent_level=2)._get_indent(4, " ")
+    b = RawLineNode("b", indent_level=2)._get_indent(4, " ")
+    assert a == " " * 8
+    assert a is b
+
+
+def test_docstring_node_multi_line_indented():
+    """Test that every line of a multi-line docstring is indented."""
+    node = DocstringNode("Line 1\n\nLine 3", indent_level=1)
+    assert node.render() == '    """\n    Line 1\n    \n    Line 3\n    """'
+
+
+def test_code_changes_show_up_when_written():
+    """Test that reassigning code switches between blank and indented output."""
+    node = RawLineNode("   ", indent_level=1)
+    node.code = "x = 1"
+    assert node.render() == "    x = 1"
+    node.code = ""
+    assert node.render() == ""
+
+
+def test_text_changes_show_up_when_written():
+    """Test that reassigning text updates comment and docstring output."""
+    comment = CommentNode("old")
+    comment.text = "new"
+    assert comment.render() == "# new"
+
+    doc = DocstringNode("Single", indent_level=1)
+    doc.text = "Line 1\nLine 2"
+    assert doc.render() == '    """\n    Line 1\n    Line 2\n    """'
+    doc.text = "Single again"
+    assert doc.render() == '    """Single again"""'
+
+
+def test_line_nodes_have_no_instance_dict():
+    """Test that per-line nodes store their fields in slots."""
+    for node in (
+        RawLineNode("x = 1"),
+        BlankLineNode(),
+        CommentNode("note"),
+        DocstringNode("Doc"),
+    ):
+        assert not hasattr(node, "__dict__")
+
+
+def test_blank_line_node_is_shared():
+    """Test that every BlankLineNode is the same instance."""
+    assert BlankLineNode() is BlankLineNode()
+    assert BlankLineNode().render() == ""
+
+
+def test_top_level_lines_are_written_as_is():
+    """Test that level-0 nodes write their stored text without copying."""
+    out = []
+    line = RawLineNode("value = compute_something_long(argument_one, argument_two)")
+    comment = CommentNode("note")
+    line.write(out)
+    comment.write(out)
+    assert out[0] is line.code
+    assert out[1] == "# note"
+
+
+class RenderOnlyNode(Node):
+    """Node subclass written against the render()-only API."""
+
+    def render(self, indent_size: int = 4, indent_char: str = " ") -> str:
+        pad = self._get_indent(indent_size, indent_char)
+        return f"{pad}a = 1\n{pad}b = 2"
+
+
+def test_render_only_subclass_is_written_by_parents():
+    """Test that subclasses implementing only render() still work."""
+    func = FunctionNode("f")
+    func.add_child(RenderOnlyNode(1))
+    out = []
+    func.write(out)
+    assert out == ["def f():", "    a = 1", "    b = 2"]
+
+
+def test_subclass_without_write_or_render():
+    """Test that a subclass implementing neither method cannot be created."""
+
+    class EmptyNode(Node):
+        pass
+
+    with pytest.raises(TypeError):
+        EmptyNode()
+    with pytest.raises(TypeError):
+        Node()
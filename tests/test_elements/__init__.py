@@ -0,0 +1 @@
+"""Test elements package."""
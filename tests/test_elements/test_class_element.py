@@ -0,0 +1,40 @@
+"""Tests for class nodes."""
+
+from codecraft.elements.class_element import ClassNode
+
+
+def test_class_bases():
+    """Test rendering of a class with base classes."""
+    node = ClassNode("Child", bases=["Base", "Mixin"])
+    assert node.render() == "class Child(Base, Mixin):\n    pass"
+
+
+def test_mutated_bases_are_rendered():
+    """Test that changes to bases are picked up without extra calls."""
+    node = ClassNode("Child", bases=["A"])
+    node.bases.append("B")
+    assert node.render().startswith("class Child(A, B):")
+
+
+def test_class_decorators_are_normalized():
+    """Test that decorators get an @ prefix when missing."""
+    node = ClassNode("Point", decorators=["dataclass", "@total_ordering"])
+    assert node.render() == "@dataclass\n@total_ordering\nclass Point:\n    pass"
+
+
+def test_docstring_attribute_assigned_directly():
+    """Test that a directly assigned docstring is rendered at the right level."""
+    node = ClassNode("C")
+    node.docstring = "hi"
+    assert node.render() == 'class C:\n    """hi"""'
+
+    node.set_docstring("d")
+    node.indent_level = 1
+    assert node.render() == '    class C:\n        """d"""'
+
+
+def test_mutated_decorators_are_rendered():
+    """Test that decorators appended after construction are rendered."""
+    node = ClassNode("Point")
+    node.decorators.append("dataclass")
+    assert node.render().startswith("@dataclass\nclass Point:")
@@ -0,0 +1,40 @@
+"""Tests for function and method nodes."""
+
+from codecraft.elements.function_element import FunctionNode, MethodNode
+
+
+def test_function_signature():
+    """Test rendering of a function signature."""
+    node = FunctionNode("add", params=["a: int", "b: int"], returns="int")
+    assert node.render() == "def add(a: int, b: int) -> int:\n    pass"
+
+
+def test_mutated_signature_is_rendered():
+    """Test that changes to params and returns are picked up without extra calls."""
+    node = FunctionNode("f", params=["a"])
+    node.params.append("b")
+    node.returns = "None"
+    assert node.render().startswith("def f(a, b) -> None:")
+
+
+def test_method_adds_self():
+    """Test that methods get 'self' unless self or cls is already first."""
+    assert MethodNode("m").params == ["self"]
+    assert MethodNode("m", params=["cls"]).params == ["cls"]
+    assert MethodNode("m", params=["self: 'A'", "x"]).params == ["self: 'A'", "x"]
+    assert MethodNode("m", params=["myself: int"]).params == ["self", "myself: int"]
+    assert MethodNode("m", params=["cls_name"]).params == ["self", "cls_name"]
+
+
+def test_docstring_attribute_assigned_directly():
+    """Test that a directly assigned docstring is rendered."""
+    node = FunctionNode("f")
+    node.docstring = "hi"
+    assert node.render() == 'def f():\n    """hi"""'
+
+
+def test_mutated_decorators_are_rendered():
+    """Test that decorators appended after construction are rendered."""
+    node = FunctionNode("f")
+    node.decorators.append("staticmethod")
+    assert node.render().startswith("@staticmethod\ndef f():")
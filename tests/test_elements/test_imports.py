@@ -0,0 +1,77 @@
+"""Tests for import nodes and the ImportManager."""
+
+from codecraft.elements.imports import FromImportNode, ImportManager
+
+
+def test_from_imports_merge_in_first_seen_order():
+    """Test that from-imports for one module merge without duplicates."""
+    manager = ImportManager()
+    manager.add_from_import("typing", ["List", "Dict"])
+    manager.add_from_import("typing", ["Dict", "Optional"])
+
+    rendered = [node.render() for node in manager.get_import_nodes()]
+    assert rendered == ["from typing import List, Dict, Optional"]
+
+
+def test_import_nodes_sorted_by_module():
+    """Test that plain imports come first, each group sorted by module."""
+    manager = ImportManager()
+    manager.add_from_import("typing", ["List"])
+    manager.add_import("sys")
+    manager.add_from_import("collections", ["deque"])
+    manager.add_import("os")
+
+    rendered = [node.render() for node in manager.get_import_nodes()]
+    assert rendered == [
+        "import os",
+        "import sys",
+        "from collections import deque",
+        "from typing import List",
+    ]
+
+
+def test_duplicate_imports_are_rendered_once():
+    """Test that repeated imports are deduplicated."""
+    manager = ImportManager()
+    manager.add_import("os")
+    manager.add_import("os")
+    manager.add_import("numpy", "np")
+
+    rendered = [node.render() for node in manager.get_import_nodes()]
+    assert rendered == ["import numpy as np", "import os"]
+
+
+def test_from_import_nodes_hash_like_equality():
+    """Test that equal from-imports hash equally regardless of order."""
+    a = FromImportNode("typing", ["List", "Dict"])
+    b = FromImportNode("typing", ["Dict", "List", "List"])
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+
+    a.items.append("Optional")
+    b.items.append("Optional")
+    assert hash(a) == hash(b)
+    assert hash(a) != hash(FromImportNode("typing", ["List", "Dict"]))
+
+
+def test_from_import_accepts_single_name_string():
+    """Test that a single name passed as a string is not split into letters."""
+    manager = ImportManager()
+    manager.add_from_import("os", "path")
+
+    rendered = [node.render() for node in manager.get_import_nodes()]
+    assert rendered == ["from os import path"]
+
+
+def test_is_empty_tracks_added_imports():
+    """Test that is_empty() agrees with get_import_nodes()."""
+    manager = ImportManager()
+    assert manager.is_empty()
+
+    manager.add_from_import("typing", ["List"])
+    assert not manager.is_empty()
+    assert manager.get_import_nodes()
+
+    manager.clear()
+    assert manager.is_empty()
@@ -0,0 +1 @@
+"""Test utils package."""
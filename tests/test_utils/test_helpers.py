@@ -0,0 +1,12 @@
+"""Tests for utility helpers."""
+
+from codecraft.utils import ensure_list
+
+
+def test_ensure_list():
+    """Test conversion of values to lists."""
+    items = ["a", "b"]
+    assert ensure_list(None) == []
+    assert ensure_list(items) is items
+    assert ensure_list(("a", "b")) == ["a", "b"]
+    assert ensure_list("a") == ["a"]